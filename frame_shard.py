@@ -0,0 +1,252 @@
+import argparse
+import contextlib
+import importlib.util
+import itertools
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import av
+
+from manim import *
+from manim.utils.exceptions import EndSceneEarlyException
+
+
+# Usage:
+#   python frame_shard.py torus_scene.py TorusScene --list
+#   python frame_shard.py torus_scene.py TorusScene --play 10 --workers 8 -q h
+#
+# Splits the frames of a single `play` call across worker processes. Every
+# worker replays the scene deterministically up to that play, stepping each
+# earlier play frame by frame with rasterizing and movie writing switched
+# off. manim's -n option is not used: it jumps a skipped play to its end in
+# one step, so dt-based updaters such as ambient camera rotation would drift
+# by one frame's worth per skipped play. The target play is stepped the same
+# way, but each worker rasterizes only its own contiguous frame range. The
+# resulting segments are stream-copied into one movie, so nothing is
+# re-encoded.
+
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+class FrameShardMixin:
+    # Index of the play to shard; None records every play instead
+    shard_play = None
+    shard_start = 0
+    shard_end = 0
+
+    def play(self, *args, **kwargs):
+        index = self.renderer.num_plays
+        if self.shard_play is not None and index > self.shard_play:
+            raise EndSceneEarlyException()
+        renderer = self.renderer
+        writer = renderer.file_writer
+
+        # Swap the renderer's per-frame hook for one that counts frames and
+        # only rasterizes those inside this shard's range of the target play
+        original_render = renderer.render
+        frames = itertools.count()
+        is_target = index == self.shard_play
+
+        def render(scene, time, moving_mobjects):
+            if self.shard_start <= next(frames) < self.shard_end and is_target:
+                original_render(scene, time, moving_mobjects)
+
+        renderer_patches = {"render": render}
+        writer_patches = {}
+        if not is_target:
+            # Step every frame like a serial render, but draw and write nothing
+            original_add_partial_movie_file = writer.add_partial_movie_file
+            renderer_patches.update(update_frame=do_nothing, add_frame=do_nothing)
+            writer_patches.update(
+                begin_animation=do_nothing,
+                end_animation=do_nothing,
+                add_partial_movie_file=lambda animation_hash: original_add_partial_movie_file(None),
+            )
+        with patched(renderer, renderer_patches), patched(writer, writer_patches):
+            super().play(*args, **kwargs)
+        if self.shard_play is None or is_target:
+            self.shard_plays.append(
+                (index, ", ".join(type(anim).__name__ for anim in self.animations), next(frames))
+            )
+        # Nothing after the target play is needed
+        if is_target:
+            raise EndSceneEarlyException()
+
+    def setup(self):
+        super().setup()
+        self.shard_plays = []
+
+
+def do_nothing(*args, **kwargs):
+    pass
+
+
+@contextlib.contextmanager
+def patched(obj, attributes):
+    # Shadows methods with instance attributes for the duration of the block
+    for name, value in attributes.items():
+        setattr(obj, name, value)
+    try:
+        yield obj
+    finally:
+        for name in attributes:
+            delattr(obj, name)
+
+
+def load_scene_class(scene_file, scene_name):
+    spec = importlib.util.spec_from_file_location(Path(scene_file).stem, scene_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def make_shard_scene(scene_cls, play=None, start=0, end=0):
+    # Same name as the original so manim's output layout is unchanged
+    return type(
+        scene_cls.__name__,
+        (FrameShardMixin, scene_cls),
+        {"shard_play": play, "shard_start": start, "shard_end": end},
+    )
+
+
+def plan_plays(scene_file, scene_name, quality, play=None):
+    # Runs the scene without rasterizing or writing anything and returns
+    # (index, animations, frame count) for each play that was stepped through.
+    # Frozen waits are written without rendering any frame, so they count 0
+    # This pass also fills the shared Tex and Text caches the workers reuse
+    options = {
+        "quality": quality,
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "disable_caching": True,
+    }
+    with tempconfig(options):
+        scene = make_shard_scene(load_scene_class(scene_file, scene_name), play)()
+        scene.render()
+    return scene.shard_plays
+
+
+def render_shard(scene_file, scene_name, quality, play, start, end, media_dir, tex_dir, text_dir):
+    options = {
+        "quality": quality,
+        # A private media_dir keeps the shards' partial movie files apart,
+        # while LaTeX and text renders come from the shared caches
+        "media_dir": media_dir,
+        "tex_dir": tex_dir,
+        "text_dir": text_dir,
+        # Shards of the same play would otherwise share a cache entry
+        "disable_caching": True,
+        "write_to_movie": True,
+        "save_last_frame": False,
+        "preview": False,
+        "progress_bar": "none",
+    }
+    with tempconfig(options):
+        scene_cls = make_shard_scene(load_scene_class(scene_file, scene_name), play, start, end)
+        scene = scene_cls()
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def concat_segments(segment_paths, output_path, work_dir):
+    # ffmpeg's concat demuxer rebases timestamps; packets are copied as-is.
+    # Returns the number of frames written
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    file_list = Path(work_dir) / "segments.txt"
+    file_list.write_text("".join(f"file '{Path(p).resolve()}'\n" for p in segment_paths))
+    with av.open(str(file_list), format="concat", options={"safe": "0"}) as segments:
+        in_stream = segments.streams.video[0]
+        with av.open(str(output_path), mode="w") as output:
+            out_stream = output.add_stream(template=in_stream)
+            frame_count = 0
+            for packet in segments.demux(in_stream):
+                if packet.dts is None:
+                    continue
+                packet.stream = out_stream
+                output.mux(packet)
+                frame_count += 1
+    return frame_count
+
+
+def shard_ranges(frame_count, workers):
+    # Contiguous, near-equal ranges; empty ranges are dropped
+    if workers < 1:
+        raise ValueError(f"Need at least one worker, got {workers}")
+    bounds = [frame_count * k // workers for k in range(workers + 1)]
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def render_sharded(scene_file, scene_name, play, workers, quality, output_path):
+    plays = plan_plays(scene_file, scene_name, quality, play)
+    if not plays:
+        raise ValueError(f"{scene_name} has no play with index {play}")
+    frame_count = plays[0][2]
+    if frame_count == 0:
+        raise ValueError(f"Play {play} of {scene_name} is a frozen frame and has no frames to shard")
+
+    tex_dir = str(config.get_dir("tex_dir"))
+    text_dir = str(config.get_dir("text_dir"))
+    with tempfile.TemporaryDirectory() as tmp:
+        ranges = shard_ranges(frame_count, workers)
+        # Spawned workers start from manim's default config, not this process's
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(ranges), mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    render_shard, scene_file, scene_name, quality, play,
+                    start, end, str(Path(tmp) / f"shard_{k:03d}"), tex_dir, text_dir,
+                )
+                for k, (start, end) in enumerate(ranges)
+            ]
+            # Results are collected in frame order, not completion order
+            segment_paths = [future.result() for future in futures]
+        written = concat_segments(segment_paths, output_path, tmp)
+    if written != frame_count:
+        raise RuntimeError(f"Expected {frame_count} frames in {output_path}, wrote {written}")
+    return Path(output_path)
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render one play of a scene across several processes")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("--play", type=int, help="index of the play to render, as shown by --list")
+    parser.add_argument("--list", action="store_true", help="list plays with their frame counts")
+    parser.add_argument("--workers", type=positive_int, default=os.cpu_count())
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    parser.add_argument("-o", "--output", help="output movie path")
+    args = parser.parse_args()
+    quality = QUALITY_FLAGS[args.quality]
+
+    if args.list:
+        for index, animations, frame_count in plan_plays(args.scene_file, args.scene_name, quality):
+            frames = f"{frame_count:6d} frames" if frame_count else "frozen frame"
+            print(f"{index:4d}  {frames:>12}  {animations}")
+        return
+    if args.play is None:
+        parser.error("either --list or --play is required")
+
+    output = args.output or f"{args.scene_name}_play{args.play:03d}.mp4"
+    path = render_sharded(args.scene_file, args.scene_name, args.play, args.workers, quality, output)
+    print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("av")
+
+import av
+
+from frame_shard import plan_plays, render_sharded, shard_ranges
+
+
+SCENE_SOURCE = """
+from manim import *
+
+
+class ShardScene(Scene):
+    def construct(self):
+        square = Square()
+        self.play(Create(square), run_time=1)
+        self.play(square.animate.rotate(PI / 3), run_time=1)
+"""
+
+
+@pytest.mark.parametrize("frame_count", [1, 2, 7, 60, 61])
+@pytest.mark.parametrize("workers", [1, 2, 3, 8, 100])
+def test_shard_ranges_cover_frames_contiguously(frame_count, workers):
+    ranges = shard_ranges(frame_count, workers)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == frame_count
+    assert all(end > start for start, end in ranges)
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert len(ranges) == min(frame_count, workers)
+
+
+def test_shard_ranges_empty_play():
+    assert shard_ranges(0, 4) == []
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_shard_ranges_rejects_no_workers(workers):
+    with pytest.raises(ValueError):
+        shard_ranges(10, workers)
+
+
+@pytest.mark.parametrize("play", [0, 1])
+def test_render_sharded_writes_planned_frames(tmp_path, monkeypatch, play):
+    monkeypatch.chdir(tmp_path)
+    scene_file = tmp_path / "shard_scene.py"
+    scene_file.write_text(SCENE_SOURCE)
+
+    [(index, _, frame_count)] = plan_plays(str(scene_file), "ShardScene", "low_quality", play)
+    assert index == play
+
+    output = render_sharded(str(scene_file), "ShardScene", play, 3, "low_quality", tmp_path / "out.mp4")
+    with av.open(str(output)) as container:
+        decoded = sum(1 for _ in container.decode(video=0))
+    assert decoded == frame_count
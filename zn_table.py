@@ -0,0 +1,241 @@
+from manim import *
+
+
+# Binary operations on Z_n, written so they broadcast over whole index grids
+ZN_OPERATIONS = {
+    "add": lambda a, b, n: (a + b) % n,
+    "mul": lambda a, b, n: (a * b) % n,
+}
+
+
+def zn_operation_table(n, operation="mul"):
+    # Column vector against row vector gives the full n x n table in one shot
+    a = np.arange(n, dtype=np.int64)
+    return ZN_OPERATIONS[operation](a[:, None], a[None, :], n)
+
+
+def zn_units(n):
+    # Boolean vector: x is a unit of Z_n exactly when gcd(x, n) = 1
+    return np.gcd(np.arange(n), n) == 1
+
+
+def zn_square_roots_of_one(n):
+    # Boolean vector: x with x^2 = 1 (mod n)
+    a = np.arange(n, dtype=np.int64)
+    return (a * a) % n == 1 % n
+
+
+def units_mask(n):
+    # Cells (a, b) with both a and b units, i.e. the table of the unit group
+    units = zn_units(n)
+    return units[:, None] & units[None, :]
+
+
+def square_roots_of_one_mask(n):
+    # Cells (a, b) with a^2 = b^2 = 1, i.e. the table of that subgroup
+    roots = zn_square_roots_of_one(n)
+    return roots[:, None] & roots[None, :]
+
+
+def row_mask(n, row):
+    mask = np.zeros((n, n), dtype=bool)
+    mask[row % n] = True
+    return mask
+
+
+def value_color_lut(n, colors=(BLUE_E, TEAL, YELLOW, RED), zero_color=None):
+    # One RGBA entry per residue, linearly interpolated between the anchor colours
+    anchors = np.array([color_to_rgb(color) for color in colors])
+    stops = np.linspace(0, 1, len(anchors))
+    t = np.linspace(0, 1, n)
+    lut = np.empty((n, 4), dtype=np.uint8)
+    for channel in range(3):
+        lut[:, channel] = np.round(255 * np.interp(t, stops, anchors[:, channel]))
+    lut[:, 3] = 255
+    if zero_color is not None:
+        lut[0, :3] = np.round(255 * np.array(color_to_rgb(zero_color)))
+    return lut
+
+
+class ZnOperationTable(ImageMobject):
+    # The whole table is a single image: one pixel per cell, scaled up with
+    # nearest-neighbour resampling, so it stays cheap for n in the thousands
+    def __init__(
+        self,
+        n,
+        operation="mul",
+        colors=(BLUE_E, TEAL, YELLOW, RED),
+        zero_color=None,
+        dim_factor=0.2,
+        height=5,
+        **kwargs
+    ):
+        self.n = n
+        self.operation = operation
+        self.dim_factor = dim_factor
+        # Fancy indexing maps every residue to its colour at once; the table
+        # itself is not kept, since every copy of the mobject would carry it
+        table = zn_operation_table(n, operation)
+        self.base_pixels = value_color_lut(n, colors, zero_color)[table]
+        # Colours with the current highlight applied, rebuilt only when the
+        # highlight changes
+        self.display_pixels = self.base_pixels
+        self.hidden = np.zeros((n, n), dtype=bool)
+        super().__init__(self.base_pixels.copy(), **kwargs)
+        self.fill_opacity = 1
+        self.stroke_opacity = 1
+        self.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        self.height = height
+
+    def highlight(self, mask):
+        # Dim every cell outside the mask; pass None to clear the highlight
+        if mask is None:
+            self.display_pixels = self.base_pixels
+        else:
+            dimmed = ~np.asarray(mask, dtype=bool)
+            self.display_pixels = self.base_pixels.copy()
+            self.display_pixels[dimmed, :3] = np.multiply(
+                self.base_pixels[dimmed, :3], self.dim_factor, dtype=np.float32
+            )
+        return self.update_pixels()
+
+    def highlight_units(self):
+        return self.highlight(units_mask(self.n))
+
+    def highlight_square_roots_of_one(self):
+        return self.highlight(square_roots_of_one_mask(self.n))
+
+    def highlight_row(self, row):
+        return self.highlight(row_mask(self.n, row))
+
+    def set_visible(self, mask):
+        # Cells outside the mask are fully transparent; None shows everything
+        if mask is None:
+            self.hidden[...] = False
+        else:
+            self.hidden[...] = ~np.asarray(mask, dtype=bool)
+        return self.update_pixels()
+
+    def show_cells(self, cells, visible=True):
+        # Only touches the alpha of the given flat cell indices, so an
+        # animation can reveal a few cells per frame without a full rebuild
+        rows, cols = np.divmod(cells, self.n)
+        self.hidden[rows, cols] = not visible
+        self.pixel_array[rows, cols, 3] = self.get_cell_alpha() if visible else 0
+        return self
+
+    def get_cell_alpha(self):
+        return round(255 * self.fill_opacity)
+
+    def set_opacity(self, alpha):
+        # ImageMobject.set_opacity would also make hidden cells visible
+        self.fill_opacity = alpha
+        self.stroke_opacity = alpha
+        return self.update_pixels()
+
+    def update_pixels(self):
+        # Rebuild the displayed image in place from the colours, opacity and
+        # hidden cells
+        pixels = self.pixel_array
+        pixels[...] = self.display_pixels
+        pixels[..., 3] = self.get_cell_alpha()
+        pixels[self.hidden, 3] = 0
+        return self
+
+
+class RevealTable(Animation):
+    # Reveals the table cell by cell by editing the pixel array, never by
+    # adding mobjects; `order` is "rows", "columns" or "diagonals"
+    def __init__(self, table, order="rows", **kwargs):
+        n = table.n
+        cells = np.arange(n * n)
+        # Flat cell indices in the order they appear
+        if order == "rows":
+            self.reveal_order = cells
+        elif order == "columns":
+            self.reveal_order = cells.reshape(n, n).T.ravel()
+        elif order == "diagonals":
+            rows, cols = np.divmod(cells, n)
+            self.reveal_order = np.argsort(rows + cols, kind="stable")
+        else:
+            raise ValueError(f"Unknown reveal order: {order}")
+        self.revealed = 0
+        super().__init__(table, **kwargs)
+
+    def begin(self):
+        # Start from an empty table; each frame then only changes the cells
+        # between the previous and the new cursor position
+        self.mobject.set_visible(np.zeros((self.mobject.n, self.mobject.n), dtype=bool))
+        self.revealed = 0
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        # Overriding interpolate_mobject bypasses get_sub_alpha, so apply rate_func here
+        total = len(self.reveal_order)
+        count = min(max(round(self.rate_func(alpha) * total), 0), total)
+        if count > self.revealed:
+            self.mobject.show_cells(self.reveal_order[self.revealed:count])
+        elif count < self.revealed:
+            self.mobject.show_cells(self.reveal_order[count:self.revealed], visible=False)
+        self.revealed = count
+
+
+class ZnTableScene(Scene):
+    def construct(self):
+        # Small multiplication table; in Z_15 the units and the square roots
+        # of 1 differ, unlike Z_12 where every unit squares to 1
+        n = 15
+        title = MathTex(r"\text{Multiplication in } \mathbb{Z}_{" + str(n) + "}")
+        title.to_edge(UP)
+        self.play(Write(title))
+
+        table = ZnOperationTable(n, "mul", zero_color=BLACK, height=5.5)
+        table.next_to(title, DOWN, buff=0.4)
+        self.play(RevealTable(table, order="rows"), run_time=2)
+        self.wait(1)
+
+        def place_label(label):
+            # Keep side labels in the space left of the table
+            max_width = table.get_left()[0] + config.frame_x_radius - 0.7
+            if label.width > max_width:
+                label.scale_to_fit_width(max_width)
+            return label.next_to(table, LEFT, buff=0.4)
+
+        # The units form a group under multiplication
+        units_label = MathTex(
+            r"\mathbb{Z}_{15}^\times = \{1, 2, 4, 7,", r"8, 11, 13, 14\}", font_size=30
+        )
+        units_label[1].next_to(units_label[0], DOWN, aligned_edge=RIGHT)
+        place_label(units_label)
+        table.highlight_units()
+        self.play(FadeIn(units_label))
+        self.wait(2)
+
+        # Only 1, 4, 11 and 14 square to 1
+        roots_label = MathTex(r"x^2 \equiv 1 \pmod{15}", font_size=36)
+        place_label(roots_label)
+        table.highlight_square_roots_of_one()
+        self.play(FadeOut(units_label), FadeIn(roots_label))
+        self.wait(2)
+
+        # Multiplying by the unit 7 permutes the residues
+        row_label = MathTex(r"7 \cdot x", font_size=36)
+        place_label(row_label)
+        table.highlight_row(7)
+        self.play(FadeOut(roots_label), FadeIn(row_label))
+        self.wait(2)
+
+        self.play(FadeOut(table), FadeOut(row_label), FadeOut(title))
+
+        # A large modulus: the structure is still visible as one image
+        big_n = 1024
+        big_title = MathTex(r"\text{Multiplication in } \mathbb{Z}_{" + str(big_n) + "}")
+        big_title.to_edge(UP)
+        big_table = ZnOperationTable(big_n, "mul", height=6)
+        big_table.next_to(big_title, DOWN, buff=0.3)
+        self.play(Write(big_title))
+        self.play(RevealTable(big_table, order="diagonals"), run_time=3)
+        self.wait(1)
+
+        big_table.highlight_units()
+        self.wait(2)